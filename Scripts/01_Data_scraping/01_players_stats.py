@@ -1,19 +1,33 @@
-from selenium import webdriver
-from selenium.webdriver.firefox.service import Service
-from selenium.webdriver.firefox.options import Options
-from bs4 import BeautifulSoup
-import time
-import pandas as pd
-from datetime import datetime
+import argparse
+from NBA_modules import TableSpec, make_session, parse_players_table, scrape_seasons
 
-def scrap_all_seasons_stats(geckodriver_path, output_path, start_year: int, end_year: int):
+# Define column names once for every worker
+STAT_NAMES = [
+    "player_name", "age", "team", "position", "game_played", "game_starter", "minutes_played",
+    "field_goal_made", "field_goal_attempts", "field_goal_percentage", "three_points_made",
+    "three_points_attempts", "three_points_percentage", "two_points_made", "two_points_attempts",
+    "two_points_percentage", "effective_fg_percentage", "free_throws_made", "free_throws_attempts",
+    "free_throws_percentage", "offensive_rebonds", "defensive_rebonds", "total_rebonds", "assists",
+    "steals", "blocks", "turnovers", "personal_fouls", "total_points", "triple_double"
+]
+
+TOTALS_SPEC = TableSpec(
+    output_name="players_data_totals",
+    url_tmpl="https://www.basketball-reference.com/leagues/NBA_{year}_totals.html",
+    table_id="totals_stats",
+    columns=tuple(STAT_NAMES),
+    parse=parse_players_table,
+)
+
+def scrap_all_seasons_stats(session, output_path, start_year: int, end_year: int, workers: int = 8):
 
     """
     Scrapes NBA players' classic total stats for each season within the given range 
     from Basketball-Reference.com and saves the data into a CSV file.
 
-    This function uses Selenium with a headless Firefox browser to navigate through 
-    the total stats pages for each NBA season between `start_year` and `end_year`. 
+    This function downloads the total stats pages for each NBA season between `start_year` and `end_year`.
+    Basketball-Reference renders these tables server-side, so no browser is needed:
+    pages are fetched with `requests`, parsed with `lxml` and `pd.read_html`, and seasons are scraped in parallel threads.
     It extracts classic player statistics (such as points, assists, rebounds, etc.) 
     from regular seasons only — no advanced stats are included in this script.
 
@@ -32,130 +46,54 @@ def scrap_all_seasons_stats(geckodriver_path, output_path, start_year: int, end_
     - Scrapes player stats from the totals table.
     - Identifies the season's MVP.
     - Adds columns indicating the MVP status and season year.
-    - Combines all the data into a single DataFrame.
-    - Saves the final combined dataset as a CSV file.
+    - Appends the season to the CSV file as soon as it is scraped (in season order).
 
     Parameters:
     ----------
-    geckodriver_path : str
-        The file path to the `geckodriver` executable for controlling the Firefox browser.
-    save_path : str
-        The file path (including file name) where the final CSV file will be saved.
+    session : requests_cache.CachedSession
+        The HTTP session used for every request (see `NBA_modules.make_session`), 
+        shared with the other scrapers when run from `__main__.py`.
+    output_path : str
+        Directory where the final CSV file will be saved (named after the dataset and the date).
     start_year : int
         The starting year of the NBA seasons to scrape (inclusive, year when the season starts).
     end_year : int
         The ending year of the NBA seasons to scrape (exclusive, year when the season starts).
+    workers : int, optional
+        Number of worker threads scraping seasons concurrently. Defaults to 8.
 
     Notes:
     -----
-    - Requires `geckodriver` installed and available at the specified `geckodriver` path.
+    - Downloads are limited to one every 3 s across all workers (Basketball-Reference.com blocks faster clients),
+      extra workers only speed up parsing and seasons already in the cache.
+    - Failed downloads are retried up to 4 times with an exponential backoff.
+    - Pages are cached on disk by the session, re-runs over past seasons don't hit the network.
     - The function adapts to changes in the Basketball-Reference.com HTML structure 
       (specifically different IDs for standings tables before and after the 2015/2016 season).
     - The script is designed to be used as a standalone module or called programmatically.
 
     Example:
     --------
-    geckodriver_path = "/opt/homebrew/bin/geckodriver"
-    save_path = "/path/to/save/nba_players_data_totals.csv"
-    scrap_all_seasons_stats(geckodriver_path, save_path, 1980, 2025)
+    session = make_session()
+    output_path = "/path/to/output/folder"
+    scrap_all_seasons_stats(session, output_path, 1980, 2025)
     # This will scrape stats from the 1980/1981 season up to (but not including) the 2025/2026 season.
     """
 
-    # Configure Firefox with Selenium
-    options = Options()
-    options.headless = True
-    service = Service(geckodriver_path)
-    driver = webdriver.Firefox(service=service, options=options) 
-    
-    # Define column names outside the loop
-    stat_names = [
-        "player_name", "age", "team", "position", "game_played", "game_starter", "minutes_played",
-        "field_goal_made", "field_goal_attempts", "field_goal_percentage", "three_points_made",
-        "three_points_attempts", "three_points_percentage", "two_points_made", "two_points_attempts",
-        "two_points_percentage", "effective_fg_percentage", "free_throws_made", "free_throws_attempts",
-        "free_throws_percentage", "offensive_rebonds", "defensive_rebonds", "total_rebonds", "assists",
-        "steals", "blocks", "turnovers", "personal_fouls", "total_points", "triple_double"
-    ]
-    
-    # Create an empty DataFrame to store all seasons
-    all_seasons_df = pd.DataFrame()
-    
-    try:
-        for year in range(start_year, end_year):
-            year += 1
-            print(f"📡 Scraping year {year}...")
-            
-            # Load the page
-            url = f"https://www.basketball-reference.com/leagues/NBA_{year}_totals.html"
-            driver.get(url)
-            time.sleep(3)
-            
-            # Get HTML and parse with BeautifulSoup
-            page_content = driver.page_source
-            parser = BeautifulSoup(page_content, "html.parser")
-            
-            # Get player stats
-            all_rs_stats = parser.select("#totals_stats tr")
-            player_stats = []
-            
-            for row in all_rs_stats:
-                cells = row.find_all('td')
-                if cells:  # Check if we have valid cells
-                    stats = {stat_name: cell.get_text(strip=True) 
-                            for stat_name, cell in zip(stat_names, cells)}
-                    if stats:
-                        player_stats.append(stats)
-            
-            # Get MVP
-            find_mvp = parser.find_all("p")
-            season_mvp = []
-            for p in find_mvp:
-                if "Most Valuable Player" in p.get_text():
-                    season_mvp.append(p.find("a").get_text(strip=True))
-                    break
-            
-            # Get season year
-            season_year = parser.select("#info h1")[0].get_text()
-            season_year_cleaned = season_year[1:5]
-            
-            # Create DataFrame for current season
-            df = pd.DataFrame(player_stats)
-            
-            # Add MVP and season columns
-            df["is_MVP"] = df["player_name"].apply(lambda x: 1 if season_mvp and x == season_mvp[0] else 0)
-            df["season_year"] = season_year_cleaned.strip()
-            
-            # Ensure all columns are present
-            for col in stat_names + ["is_MVP", "season_year"]:
-                if col not in df.columns:
-                    df[col] = None
-            
-            # Reorder columns to match stat_names
-            df = df[stat_names + ["is_MVP", "season_year"]]
-            
-            # Append to main DataFrame
-            all_seasons_df = pd.concat([all_seasons_df, df], ignore_index=True)
-            
-            print(f"✅ {len(df)} players recorded for season {year}")
-        
-        # Save all data to CSV at once
-        timestamp = datetime.today().strftime('%Y-%m-%d')
-        output_file = f"{output_path}/players_data_totals{timestamp}.csv"
-        all_seasons_df.to_csv(output_file, index=False)
-        print("\nDataFrame info:")
-        print(all_seasons_df.info())
-        print("\nFirst few rows:")
-        print(all_seasons_df.head())
-        
-    finally:
-        driver.quit()
-        print("🎉 Scraping completed! All seasons saved.")
+    scrape_seasons(TOTALS_SPEC, session, output_path, start_year, end_year, workers=workers)
 
 # ===================================
 # Execute the function
 # ===================================
 
 if __name__ == "__main__":
-    geckodriver_path = "/path/to/geckodriver"
+    arg_parser = argparse.ArgumentParser(description="Scrape NBA players' total stats from Basketball-Reference.")
+    arg_parser.add_argument("--workers", type=int, default=8, help="Number of seasons scraped in parallel")
+    args = arg_parser.parse_args()
+
     output_path = "/path/to/output/folder"
-    scrap_all_seasons_stats(geckodriver_path, output_path, 1980, 2024)
+    session = make_session()
+    try:
+        scrap_all_seasons_stats(session, output_path, 1980, 2024, workers=args.workers)
+    finally:
+        session.close()
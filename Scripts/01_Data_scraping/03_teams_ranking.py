@@ -1,19 +1,62 @@
-from selenium import webdriver
-from selenium.webdriver.firefox.service import Service
-from selenium.webdriver.firefox.options import Options
-from bs4 import BeautifulSoup
-import time
+import lxml.etree
+import argparse
 import pandas as pd
-from datetime import datetime
+from NBA_modules import TableSpec, get_season_year, make_session, scrape_seasons
 
-def scrap_all_seasons_standings(geckodriver_path, output_path, start_year: int, end_year: int):
+# XPath expressions compiled once for every worker instead of being re-parsed for each row
+STANDINGS_ROWS = lxml.etree.XPath(
+    '//table[@id=concat($prefix, "E") or @id=concat($prefix, "W")]//tr[contains(@class, "full_table")]'
+)
+TEAM_NAME = lxml.etree.XPath('string(.//a)')
+WIN_PCT = lxml.etree.XPath('string(.//*[@data-stat="win_loss_pct"])')
+
+def _parse_standings(spec, tree, year):
+    """
+    Parse the standings of both conferences of a season page into a DataFrame
+    (team, conference, win percentage and season year).
+    """
+
+    # Standings tables are split by division until the 2015/2016 season, by conference afterwards,
+    # the ids only differ by their last letter (E or W)
+    standings_id = spec.table_id_for(year)[:-1]
+
+    # Get teams standings of both conferences with a single XPath,
+    # the conference is the last letter of the id of the table the row belongs to
+    all_teams = []
+    for row in STANDINGS_ROWS(tree, prefix=standings_id):
+        teams_cells = TEAM_NAME(row)
+        wins_cells = WIN_PCT(row)
+        if teams_cells and wins_cells:
+            all_teams.append({
+                "team": teams_cells,
+                "conf": next(row.iterancestors("table")).get("id")[-1],
+                "win_pct": wins_cells
+            })
+
+    df = pd.DataFrame(all_teams, columns=list(spec.columns))
+    df["season_year"] = get_season_year(tree)
+    return df
+
+STANDINGS_SPEC = TableSpec(
+    output_name="teams_standings",
+    url_tmpl="https://www.basketball-reference.com/leagues/NBA_{year}_standings.html",
+    table_id="confs_standings_E",
+    columns=("team", "conf", "win_pct"),
+    parse=_parse_standings,
+    row_label="teams",
+    legacy_table_id="divs_standings_E",
+    legacy_seasons=range(1981, 2016),
+)
+
+def scrap_all_seasons_standings(session, output_path, start_year: int, end_year: int, workers: int = 8):
 
     """
     Scrapes NBA team standings (team name, conference, and win percentage) for each season 
     within the given range from Basketball-Reference.com, and saves the data into a CSV file.
 
-    This function uses Selenium with a headless Firefox browser to navigate through 
-    the standings pages for each NBA season between `start_year` and `end_year`.
+    This function downloads the standings pages for each NBA season between `start_year` and `end_year`.
+    Basketball-Reference renders these tables server-side, so no browser is needed:
+    pages are fetched with `requests`, parsed with `lxml`, and seasons are scraped in parallel threads.
     It extracts for each team:
     - The team name
     - Its conference (Eastern 'E' or Western 'W')
@@ -31,137 +74,58 @@ def scrap_all_seasons_standings(geckodriver_path, output_path, start_year: int,
     which name seasons based on the year when the season ends.
 
     For each season:
-    - Scrapes standings separately for both Eastern and Western Conferences.
+    - Scrapes the standings of both Eastern and Western Conferences in a single pass.
     - Extracts the season's year, team names, win percentages, and conference labels.
-    - Merges both conferences' data into a single DataFrame.
-    - Appends each season's data to a list.
-    - Concatenates all seasons into one final DataFrame.
-    - Saves the final combined dataset to a CSV file.
+    - Appends the season to the CSV file as soon as it is scraped (in season order).
 
     Parameters:
     -----------
-    geckodriver : str
-        The file path to the `geckodriver` executable for controlling the Firefox browser.
-    save_path : str
-        The file path (including file name) where the final CSV file will be saved.
+    session : requests_cache.CachedSession
+        The HTTP session used for every request (see `NBA_modules.make_session`), 
+        shared with the other scrapers when run from `__main__.py`.
+    output_path : str
+        Directory where the final CSV file will be saved (named after the dataset and the date).
     start_year : int
         The starting year of the NBA seasons to scrape (inclusive, year when the season starts).
     end_year : int
         The ending year of the NBA seasons to scrape (exclusive, year when the season starts).
+    workers : int, optional
+        Number of worker threads scraping seasons concurrently. Defaults to 8.
 
     Notes:
     ------
-    - Requires `geckodriver` installed and available at the specified `geckodriver` path.
+    - Downloads are limited to one every 3 s across all workers (Basketball-Reference.com blocks faster clients),
+      extra workers only speed up parsing and seasons already in the cache.
+    - Failed downloads are retried up to 4 times with an exponential backoff.
+    - Pages are cached on disk by the session, re-runs over past seasons don't hit the network.
     - The function adapts to changes in the Basketball-Reference.com HTML structure 
       (specifically different IDs for standings tables before and after the 2015/2016 season).
     - The script is designed to be used as a standalone module or called programmatically.
 
     Example:
     --------
-    geckodriver_path = "/path/to/geckodriver"
-    save_path = "/path/to/save/teams_standings.csv"
-    scrap_all_seasons_standings(geckodriver_path, save_path, 1980, 2025)
+    session = make_session()
+    output_path = "/path/to/output/folder"
+    scrap_all_seasons_standings(session, output_path, 1980, 2025)
     # This will scrape team standings from the 1980/1981 season up to (but not including) the 2025/2026 season.
     """
 
-    # Configure Firefox with Selenium
-    options = Options()
-    options.headless = True
-    service = Service(geckodriver_path)
-    driver = webdriver.Firefox(service=service, options=options)
-    
-    all_seasons_data = []
-
-    try : 
-        for year in range(start_year, end_year):
-            year += 1
-            print(f"📡 Scraping year {year}...")
-            
-            # Load the page
-            url = f"https://www.basketball-reference.com/leagues/NBA_{year}_standings.html"
-            driver.get(url)
-            time.sleep(3)
-            
-            # Get HTML and parse with BeautifulSoup
-            page_content = driver.page_source
-            parser = BeautifulSoup(page_content, "html.parser")
-            
-            # Get teams standings
-            # For East
-            if year in range(1981, 2016) :
-                eastern_conf = parser.select("#divs_standings_E .full_table")
-            else:
-                eastern_conf = parser.select("#confs_standings_E .full_table")
-
-            eastern_conf_teams = []
-            for row in eastern_conf:
-                teams_cells = row.find('a').text
-                wins_cells = row.find(attrs={"data-stat": "win_loss_pct"}).text
-                #conf_cell = row.find(attrs={"aria-label":"Eastern Conference"}).text
-                if teams_cells and wins_cells:
-                    east_team_data = {
-                        "team": teams_cells,
-                        "conf" : "E",
-                        "win_pct": wins_cells
-                    }
-                    eastern_conf_teams.append(east_team_data)
-
-            # For West
-            if year in range(1981, 2016) :
-                west_conf = parser.select("#divs_standings_W .full_table")
-            else:
-                west_conf = parser.select("#confs_standings_W .full_table")
-
-            western_conf_teams = []
-            for row in west_conf:
-                teams_cells = row.find('a').text
-                wins_cells = row.find(attrs={"data-stat": "win_loss_pct"}).text
-                #conf_cell = row.find(attrs={"aria-label":"Western Conference"}).text
-                if teams_cells and wins_cells:
-                    west_team_data = {
-                        "team": teams_cells,
-                        "conf" : "W",
-                        "win_pct": wins_cells
-                    }
-                    western_conf_teams.append(west_team_data)
-
-            # Merging all the teams together 
-            all_teams = western_conf_teams + eastern_conf_teams 
-
-            # Get season year
-            season_year = parser.select("#info h1")[0].get_text()
-            season_year_cleaned = season_year[1:5]
-            
-            df = pd.DataFrame(all_teams)
-            df["season_year"] = season_year_cleaned.strip()
-
-            # Save every season in a list outside of the loop
-            all_seasons_data.append(df)
-
-            print(f"✅ {len(df)} teams recorded for season {year}")
-
-        final_df = pd.concat(all_seasons_data, ignore_index=True)
-
-        # Save all data to CSV at once
-        timestamp = datetime.today().strftime('%Y-%m-%d')
-        output_file = f"{output_path}/teams_standings{timestamp}.csv"
-        final_df.to_csv(output_file, index=False)
-        print("\nDataFrame info:")
-        print(final_df.info())
-        print("\nFirst few rows:")
-        print(final_df.head())
-
-    finally: 
-        driver.quit()
-        print("🎉 Scraping completed! All seasons saved.")    
-        
+    scrape_seasons(STANDINGS_SPEC, session, output_path, start_year, end_year, workers=workers)
+
 # ===================================
 # Execute the function
 # ===================================
 
 if __name__ == "__main__":
-    geckodriver_path = "/path/to/geckodriver"
+    arg_parser = argparse.ArgumentParser(description="Scrape NBA team standings from Basketball-Reference.")
+    arg_parser.add_argument("--workers", type=int, default=8, help="Number of seasons scraped in parallel")
+    args = arg_parser.parse_args()
+
     output_path = "/path/to/output/folder"
-    scrap_all_seasons_standings(geckodriver_path, output_path, 1980, 2024)
+    session = make_session()
+    try:
+        scrap_all_seasons_standings(session, output_path, 1980, 2024, workers=args.workers)
+    finally:
+        session.close()
 
 
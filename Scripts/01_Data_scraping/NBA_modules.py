@@ -0,0 +1,327 @@
+import lxml.html
+import lxml.etree
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import StringIO
+from typing import Callable
+import requests
+from requests.adapters import HTTPAdapter
+import requests_cache
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, wait_exponential
+import pandas as pd
+from datetime import datetime, timedelta
+
+# Browser-like headers, basketball-reference rejects the default requests User-Agent
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    )
+}
+
+# Basketball-Reference blocks clients above about 20 requests per minute (for an hour or more),
+# downloads are spaced by at least this many seconds across every thread of the session
+MIN_REQUEST_INTERVAL = 3.0
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTP adapter letting at most one request reach the network every `min_interval` seconds,
+    whatever the number of threads sharing the session.
+
+    Pages served from the requests_cache cache never reach the adapter, so they aren't delayed.
+    Once the server answers 429 (Too Many Requests) the client is blocked, retrying only extends
+    the block: every later request of the session fails right away instead of reaching the network.
+    """
+
+    def __init__(self, min_interval=MIN_REQUEST_INTERVAL, **kwargs):
+        super().__init__(**kwargs)
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_request = 0.0
+        self._blocked = None
+
+    def send(self, request, **kwargs):
+        # Book the next slot under the lock, then wait for it outside so other threads can book theirs
+        with self._lock:
+            self._raise_if_blocked()
+            now = time.monotonic()
+            slot = max(now, self._next_request)
+            self._next_request = slot + self.min_interval
+        time.sleep(slot - now)
+        self._raise_if_blocked()
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            wait = f"{retry_after} s (Retry-After)" if retry_after else "an hour or more"
+            self._blocked = (f"Basketball-Reference rate limit reached (HTTP 429 on {request.url}), "
+                             f"wait {wait} before scraping again")
+            self._raise_if_blocked()
+        return response
+
+    def _raise_if_blocked(self):
+        if self._blocked is not None:
+            raise RuntimeError(self._blocked)
+
+def make_session(cache_name="bbref_cache"):
+    """
+    Create the HTTP session shared by the Basketball-Reference scrapers.
+
+    A single session keeps its connections to basketball-reference.com alive
+    (keep-alive connection pool), so creating it once and handing it to every scraper
+    avoids paying the TCP/TLS handshake again for each script and each season.
+
+    Responses are also cached on disk (SQLite file `<cache_name>.sqlite`): pages of past
+    seasons never change, so re-running the scrapers only re-parses them instead of
+    downloading them again. Cached pages expire after 30 days, except the pages of the
+    season in progress which are only kept for an hour.
+
+    Downloads go through a single rate limiter shared by every thread using the session
+    (at most one request every `MIN_REQUEST_INTERVAL` seconds), cached pages skip it.
+
+    Parameters:
+    -----------
+    cache_name : str, optional
+        Name (or path without extension) of the on-disk cache. Defaults to "bbref_cache".
+
+    Returns:
+    --------
+    requests_cache.CachedSession
+        A cached session with browser-like headers. The caller is responsible for closing it.
+    """
+
+    # Basketball-Reference names seasons by the year they end, the one in progress
+    # ends either this year (January-June) or next year (October-December)
+    current_year = datetime.today().year
+    session = requests_cache.CachedSession(
+        cache_name,
+        expire_after=timedelta(days=30),
+        urls_expire_after={
+            f"*/NBA_{current_year}_*": 3600,
+            f"*/NBA_{current_year + 1}_*": 3600,
+        },
+    )
+    session.headers.update(HEADERS)
+    adapter = RateLimitedAdapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def to_compact_numeric(column):
+    """
+    Convert a column of scraped strings to the smallest numeric dtype able to hold it.
+
+    Whole-number columns (age, games, counts) are downcast to int8/int16/int32, any column
+    with decimals or missing values is stored as float32 instead of float64.
+
+    Parameters:
+    -----------
+    column : pd.Series
+        Column of numbers as scraped from the page (strings, empty cells become NaN).
+
+    Returns:
+    --------
+    pd.Series
+        The column converted to a compact numeric dtype.
+    """
+
+    numbers = pd.to_numeric(column, errors="coerce", downcast="integer")
+    if numbers.dtype.kind == "f":
+        numbers = numbers.astype("float32")
+    return numbers
+
+@dataclass(frozen=True)
+class TableSpec:
+    """
+    Description of one Basketball-Reference table scraped season by season.
+
+    The three scrapers only differ by the page they download, the table they wait for,
+    the columns they keep and how the table is turned into a DataFrame, everything else
+    (download, cache, threads, CSV output) is shared by `scrape_seasons`.
+
+    Attributes:
+    -----------
+    output_name : str
+        Prefix of the CSV file written by `scrape_seasons` (followed by the date).
+    url_tmpl : str
+        URL of the season page, with a `{year}` placeholder (year when the season ends).
+    table_id : str
+        Id of the table the page is awaited on and parsed from.
+    columns : tuple of str
+        Names given to the scraped columns, in the order of the table.
+    parse : Callable
+        `parse(spec, tree, year)` returning the DataFrame of one season from the parsed page.
+    row_label : str, optional
+        What a row is, used in progress messages. Defaults to "players".
+    legacy_table_id : str, optional
+        Id of the table for the seasons in `legacy_seasons`, when the page layout changed.
+    legacy_seasons : range, optional
+        Seasons (year when the season ends) using `legacy_table_id`.
+    """
+
+    output_name: str
+    url_tmpl: str
+    table_id: str
+    columns: tuple
+    parse: Callable
+    row_label: str = "players"
+    legacy_table_id: str = None
+    legacy_seasons: range = range(0)
+
+    def table_id_for(self, year):
+        """Id of the table to scrape for the season ending in `year`."""
+        return self.legacy_table_id if year in self.legacy_seasons else self.table_id
+
+def _is_transient(error):
+    """Whether a failed download is worth retrying: connection errors, 5xx answers and missing tables."""
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status is None or status >= 500
+    return isinstance(error, (requests.RequestException, LookupError))
+
+def _fetch_page(session, url, table_id):
+    """
+    Download `url` and return the page parsed by lxml once the table `table_id` is present.
+
+    Failed downloads (connection errors, 5xx answers) and pages missing the table are
+    retried up to 4 times with an exponential backoff, so a transient error doesn't abort
+    a whole run over 45 seasons. The last error is raised if every attempt fails, other
+    HTTP errors (e.g. 404 for a season page that doesn't exist) are raised right away.
+    A 429 answer is never retried: the session refuses any further download (see `RateLimitedAdapter`).
+    """
+
+    retrying = Retrying(
+        retry=retry_if_exception(_is_transient),
+        stop=stop_after_attempt(4),
+        wait=wait_exponential(multiplier=1, max=30),
+        reraise=True,
+    )
+    for attempt in retrying:
+        with attempt:
+            # Never trust a cached copy of a page when retrying
+            force_refresh = attempt.retry_state.attempt_number > 1
+            response = session.get(url, timeout=15, force_refresh=force_refresh)
+            response.raise_for_status()
+            tree = lxml.html.fromstring(response.text)
+
+            if tree.get_element_by_id(table_id, None) is None:
+                raise LookupError(f"Table #{table_id} not found on {url}")
+    return tree
+
+def get_season_year(tree):
+    """Year when the season starts, read from the title of a season page (e.g. "2023-24 NBA ...")."""
+    return tree.xpath('//*[@id="info"]//h1')[0].text_content()[1:5].strip()
+
+# The MVP is the first link of the summary paragraph mentioning the award,
+# compiled once instead of rendering the text of every paragraph of the page
+SEASON_MVP = lxml.etree.XPath('string((//p[contains(., "Most Valuable Player")])[1]//a)')
+
+def get_season_mvp(tree):
+    """Name of the season's MVP as listed in the page summary, or None if it isn't awarded yet."""
+    season_mvp = SEASON_MVP(tree).strip()
+    return season_mvp or None
+
+def parse_players_table(spec, tree, year):
+    """
+    Parse a players table (totals or advanced stats) of a season page into a DataFrame
+    with the columns of `spec`, plus the `is_MVP` flag and the `season_year`.
+    """
+
+    columns = list(spec.columns)
+
+    # Get player stats, the whole table is parsed in one call by pandas (lxml flavor)
+    # instead of looping over every row and cell in Python
+    stats_table = lxml.html.tostring(tree.get_element_by_id(spec.table_id_for(year)), encoding="unicode")
+    df = pd.read_html(StringIO(stats_table), flavor="lxml")[0]
+
+    # Drop the rank column, keep the stat columns and the repeated header rows out
+    # (Basketball-Reference always serves the full column set, so every spec column is there)
+    df = df.iloc[:, 1:len(columns) + 1]
+    df.columns = columns
+    df = df[df["player_name"] != "Player"].reset_index(drop=True)
+
+    # Cast every stat column to compact numeric dtypes
+    numeric_cols = [col for col in df.columns if col not in ("player_name", "team", "position")]
+    df[numeric_cols] = df[numeric_cols].apply(to_compact_numeric)
+
+    # Add MVP and season columns
+    season_mvp = get_season_mvp(tree)
+    df["is_MVP"] = (df["player_name"].to_numpy() == season_mvp).astype("int8") if season_mvp else 0
+    df["season_year"] = get_season_year(tree)
+    return df
+
+def scrape_season(spec, session, year):
+    """
+    Scrape the table described by `spec` for a single season (`year` is the year the season ends, 
+    as in Basketball-Reference URLs) through the shared HTTP session and return it as a DataFrame.
+    """
+
+    print(f"📡 Scraping year {year}...")
+
+    # Load and parse the page as soon as the table is present
+    tree = _fetch_page(session, spec.url_tmpl.format(year=year), spec.table_id_for(year))
+    df = spec.parse(spec, tree, year)
+
+    print(f"✅ {len(df)} {spec.row_label} recorded for season {year}")
+    return df
+
+def scrape_seasons(spec, session, output_path, start_year: int, end_year: int, workers: int = 8):
+    """
+    Scrape the table described by `spec` for every season between `start_year` and `end_year`
+    (years when the seasons start, `end_year` excluded) and save them into a single CSV file.
+
+    Parameters:
+    -----------
+    spec : TableSpec
+        The table to scrape.
+    session : requests_cache.CachedSession
+        The HTTP session used for every request (see `make_session`).
+    output_path : str
+        Directory where the CSV file will be saved, named after `spec.output_name` and the date.
+    start_year : int
+        The starting year of the NBA seasons to scrape (inclusive, year when the season starts).
+    end_year : int
+        The ending year of the NBA seasons to scrape (exclusive, year when the season starts).
+    workers : int, optional
+        Number of worker threads scraping seasons concurrently. Defaults to 8.
+        Downloads stay rate-limited by the session, extra workers only overlap parsing and cache hits.
+
+    Returns:
+    --------
+    str
+        Path of the CSV file written.
+    """
+
+    seasons = range(start_year + 1, end_year + 1)
+
+    # The CSV is opened once and every season is appended as soon as it is scraped,
+    # so memory stays flat instead of holding all seasons until the end
+    timestamp = datetime.today().strftime('%Y-%m-%d')
+    output_file = f"{output_path}/{spec.output_name}{timestamp}.csv"
+    rows_saved = 0
+
+    # Scrape seasons in parallel threads sharing the caller's HTTP session (and its rate limiter),
+    # so parsing and cached seasons overlap with the downloads that have to wait for their turn
+    with ThreadPoolExecutor(max_workers=workers) as executor, open(output_file, "w", newline="", encoding="utf-8") as csv_file:
+        futures = deque(executor.submit(scrape_season, spec, session, year) for year in seasons)
+
+        # Write results in season order, with the header on the first season only.
+        # Each future is dropped once written, so its season DataFrame can be freed right away
+        first = True
+        try:
+            while futures:
+                season_df = futures.popleft().result()
+                season_df.to_csv(csv_file, index=False, header=first)
+                rows_saved += len(season_df)
+                first = False
+        except Exception:
+            # A failed season (e.g. blocked by the server) stops the run, seasons not started are cancelled
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    print(f"\n{rows_saved} rows saved to {output_file}")
+    print("🎉 Scraping completed! All seasons saved.")
+    return output_file
@@ -0,0 +1,45 @@
+import argparse
+import importlib
+from NBA_modules import make_session
+
+# Script names start with a digit, so they can't be imported with a plain import statement
+players_stats = importlib.import_module("01_players_stats")
+advanced_players_stats = importlib.import_module("02_Advanced_players_stats")
+teams_ranking = importlib.import_module("03_teams_ranking")
+
+def scrap_all(output_path, start_year: int, end_year: int, workers: int = 8):
+    """
+    Run the three Basketball-Reference scrapers (totals, advanced stats and standings)
+    one after the other with a single shared HTTP session.
+
+    Parameters:
+    -----------
+    output_path : str
+        Directory where the three CSV files will be saved.
+    start_year : int
+        The starting year of the NBA seasons to scrape (inclusive, year when the season starts).
+    end_year : int
+        The ending year of the NBA seasons to scrape (exclusive, year when the season starts).
+    workers : int, optional
+        Number of worker threads scraping seasons concurrently. Defaults to 8.
+    """
+
+    session = make_session()
+    try:
+        players_stats.scrap_all_seasons_stats(session, output_path, start_year, end_year, workers=workers)
+        advanced_players_stats.scrap_all_seasons_advanced_stats(session, output_path, start_year, end_year, workers=workers)
+        teams_ranking.scrap_all_seasons_standings(session, output_path, start_year, end_year, workers=workers)
+    finally:
+        session.close()
+
+# ===================================
+# Execute the function
+# ===================================
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Scrape every Basketball-Reference dataset used by the project.")
+    arg_parser.add_argument("--workers", type=int, default=8, help="Number of seasons scraped in parallel")
+    args = arg_parser.parse_args()
+
+    output_path = "/path/to/output/folder"
+    scrap_all(output_path, 1980, 2024, workers=args.workers)
@@ -81,19 +81,7 @@ def main_dataframe(teams_ranking_path, players_stats_path, advanced_stats_path,
     }
 
     try:
-        # Load team rankings data and Convert team full names into abbreviations for merging
-        df_ranking = pd.read_csv(teams_ranking_path)
-        df_ranking["team"] = df_ranking["team"].map(team_name_to_abbr)
-
-        # Load player statistics data and Merge player stats with team rankings based on team and season
-        df_players = pd.read_csv(players_stats_path)
-        df_augmented = pd.merge(df_players, df_ranking, on=['team', 'season_year'], how='left')
-
-        # Load advanced player statistics data and Merge with advanced stats using player name, team, and season
-        df_advanced_stats = pd.read_csv(advanced_stats_path)
-        df_final = pd.merge(df_augmented, df_advanced_stats, on=['player_name','team', 'season_year'], how='left', suffixes=('', '_adv'))
-
-        # Select columns for the final dataset
+        # Columns of the final dataset
         cols = [
             'player_name', 'position', 'age', 'team', 'conf', 'win_pct', 'game_played', 'game_starter', 'minutes_played', 
             'field_goal_made', 'field_goal_attempts', 'field_goal_percentage', 'three_points_made', 'three_points_attempts', 
@@ -112,6 +100,41 @@ def main_dataframe(teams_ranking_path, players_stats_path, advanced_stats_path,
         
         meta_cols = ['season_year', 'is_MVP']
 
+        # Only parse the columns each file contributes to the final dataset, so the merges never
+        # carry unused or duplicated columns
+        ranking_cols = ['team', 'season_year', 'conf', 'win_pct']
+        player_cols = [col for col in cols if col not in ('conf', 'win_pct')] + meta_cols
+        advanced_usecols = ['player_name', 'team', 'season_year'] + advanced_cols
+
+        # The PyArrow engine parses the CSV files with several threads instead of one,
+        # merge keys are loaded as categoricals (and compact ints for seasons)
+        key_dtypes = {"team": "category", "season_year": "int16", "player_name": "category"}
+
+        # Load team rankings data and Convert team full names into abbreviations for merging
+        # (renaming the categories maps each distinct team once instead of once per row)
+        df_ranking = pd.read_csv(teams_ranking_path, engine="pyarrow", usecols=ranking_cols, dtype={"team": "category", "season_year": "int16"})
+        df_ranking["team"] = df_ranking["team"].cat.rename_categories(team_name_to_abbr)
+
+        # Load player statistics and advanced player statistics data
+        df_players = pd.read_csv(players_stats_path, engine="pyarrow", usecols=player_cols, dtype=key_dtypes)
+        df_advanced_stats = pd.read_csv(advanced_stats_path, engine="pyarrow", usecols=advanced_usecols, dtype=key_dtypes)
+
+        # Each file has its own categories (e.g. only players have "TOT" or "2TM" teams), the keys are cast
+        # to the same categories on both sides so the joins work on codes instead of falling back to strings
+        for key, frames in (("team", (df_ranking, df_players, df_advanced_stats)), ("player_name", (df_players, df_advanced_stats))):
+            categories = frames[0][key].cat.categories
+            for frame in frames[1:]:
+                categories = categories.union(frame[key].cat.categories)
+            shared_dtype = pd.CategoricalDtype(categories)
+            for frame in frames:
+                frame[key] = frame[key].astype(shared_dtype)
+
+        # Merge player stats with team rankings based on team and season
+        df_augmented = pd.merge(df_players, df_ranking, on=['team', 'season_year'], how='left')
+
+        # Merge with advanced stats using player name, team, and season
+        df_final = pd.merge(df_augmented, df_advanced_stats, on=['player_name','team', 'season_year'], how='left')
+
         # Keep only the selected columns to create the final dataframe
         df_final = df_final[cols + advanced_cols + meta_cols]
 
@@ -1,9 +1,13 @@
 import pandas as pd
+import numpy as np
 
 from datetime import datetime
+import sys
+from pathlib import Path
 
-from sklearn.impute import SimpleImputer
-from sklearn.preprocessing import OneHotEncoder
+# Shared column schema (Scripts/common/schema.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "common"))
+from schema import CLEANED_COLUMNS
 
 
 def clean_data(raw_df, output_path):
@@ -18,17 +22,17 @@ def clean_data(raw_df, output_path):
     - Reordering columns into logical feature groups.
     - Setting percentage columns from 0-100% to 0-1 scale.
     - Handling division-by-zero cases in shooting percentages.
-    - Imputing missing values with the median of each column.
-    - Saving the cleaned DataFrame as a timestamped CSV file.
+    - Imputing missing values with the median of each column (the most frequent conference for conf).
+    - Saving the cleaned DataFrame as a timestamped Parquet file.
 
     Args:
         raw_df (str): Path to the raw CSV data file.
-        output_path (str): Directory where the cleaned CSV file will be saved.
+        output_path (str): Directory where the cleaned Parquet file will be saved.
 
     Returns:
         tuple:
         pd.DataFrame: The cleaned and preprocessed DataFrame ready for feature engineering.
-        str: The path to the saved CSV file containing the cleaned data.
+        str: The path to the saved Parquet file containing the cleaned data.
 
     Raises:
         Exception: If any error occurs during the data cleaning process, it is printed and re-raised.
@@ -36,7 +40,7 @@ def clean_data(raw_df, output_path):
 
     try :
 
-        df = pd.read_csv(raw_df)
+        df = pd.read_csv(raw_df, engine="pyarrow")
 
         # Remove "League Average" lines
         df = df.drop(df[df["player_name"] == "League Average"].index)
@@ -52,61 +56,48 @@ def clean_data(raw_df, output_path):
         # conf (binary : E = 0 ; W = 1)
         df["conf"] = df["conf"].map({"E": 0, "W": 1})
 
-        # position (OneHotEncoder)
-        ohc = OneHotEncoder(handle_unknown='ignore', sparse_output=False)
-        ohc_position = ohc.fit_transform(df["position"].values.reshape(-1, 1))
-        position_columns = ohc.get_feature_names_out(['position'])
-        position_df = pd.DataFrame(ohc_position, columns=position_columns, index=df.index)
-        df = pd.concat([df, position_df], axis=1)
+        # position (one-hot encoding built straight from the factorized codes, one int8 column per position)
+        # missing positions get the code -1 and are left with zeros everywhere
+        codes, positions = pd.factorize(df["position"].to_numpy(), sort=True)
+        rows = np.flatnonzero(codes >= 0)
+        one_hot = np.zeros((len(codes), len(positions)), dtype=np.int8)
+        one_hot[rows, codes[rows]] = 1
+        for i, position in enumerate(positions):
+            df[f"position_{position}"] = one_hot[:, i]
         df = df.drop("position", axis=1)
 
         # Repositionning Encoded positions
-        names_cols = ['player_name']
-
-        player_info = [
-            'position_C', 'position_PF', 'position_PG', 'position_SF', 'position_SG', 'age', 
-            'conf', 'win_pct', 'game_played', 'game_starter', 'minutes_played'
-            ]
-        shooting_stats = [
-            'field_goal_made', 'field_goal_attempts', 'field_goal_percentage', 'three_points_made', 
-            'three_points_attempts', 'three_points_percentage', 'two_points_made', 'two_points_attempts', 
-            'two_points_percentage', 'effective_fg_percentage', 'free_throws_made','free_throws_attempts', 
-            'free_throws_percentage'
-            ] 
-        performance_stats = [
-            'offensive_rebonds', 'defensive_rebonds', 'total_rebonds', 'assists', 'steals', 'blocks', 
-            'turnovers', 'personal_fouls', 'total_points', 'triple_double'
-            ] 
-        advanced_stats = [
-            "efficiency_rating", "true_shooting_%", "3pt_attempt_rate", "FT_attempt_rate", "off_reb_%", 
-            "def_reb_%", "total_reb_%", "assist_%", "steal_%", "blk_%", "turnover_%", "usage_%", 
-            "off_win_shares", "def_win_shares", "total_win_shares", "ws_per_48", "off_box_+/-", "def_box_+/-",
-            "box_+/-", "value_over_replacement"
-            ]
-        meta_cols = ['season_year', 'is_MVP']
-
-        df = df[names_cols + player_info + shooting_stats + performance_stats + advanced_stats + meta_cols]
+        df = df[list(CLEANED_COLUMNS)]
 
         #df = df.drop(columns=["position_nan"])
 
-        # if data in shooting attempts = 0, pct = 0
-        df.loc[df["three_points_attempts"] == 0, "three_points_percentage"] = 0.0
-        df.loc[df["two_points_attempts"] == 0, "two_points_percentage"] = 0.0
-        df.loc[df["free_throws_attempts"] == 0, "free_throws_percentage"] = 0.0
+        # if data in shooting attempts = 0, pct = 0 (the three shooting types masked at once)
+        pct_cols = ["three_points_percentage", "two_points_percentage", "free_throws_percentage"]
+        att_cols = ["three_points_attempts", "two_points_attempts", "free_throws_attempts"]
+        pct = df[pct_cols].to_numpy(dtype=np.float64, copy=True)
+        pct[df[att_cols].to_numpy() == 0] = 0.0
+        df[pct_cols] = pct
 
         # Rescale 0-100% cols to 0-1 format
         rescale_perc_cols = ["off_reb_%", "def_reb_%", "total_reb_%", "assist_%", "steal_%", "blk_%", "turnover_%", "usage_%"]
-        df[rescale_perc_cols] = (df[rescale_perc_cols] / 100).round(4)
+        perc = df[rescale_perc_cols].to_numpy(dtype=np.float64, copy=True)
+        np.divide(perc, 100, out=perc)
+        np.round(perc, 4, out=perc)
+        df[rescale_perc_cols] = perc
 
-        # Find columns with missing values and replace it with column's mediane
-        my_imputer = SimpleImputer(strategy="median")
-        df[df.columns[df.isnull().any()]] = my_imputer.fit_transform(df[df.columns[df.isnull().any()]])
+        # Missing conferences get the most frequent one (a median could fall between E and W)
+        df["conf"] = df["conf"].fillna(df["conf"].mode().iloc[0])
 
-        # Save to CSV at the end
+        # Find columns with missing values once and replace them with column's mediane
+        # (medians are only computed for these columns)
+        null_cols = df.columns[df.isna().any().to_numpy()]
+        df[null_cols] = df[null_cols].fillna(df[null_cols].median(numeric_only=True))
+
+        # Save to Parquet at the end (keeps the dtypes and loads much faster than CSV in the next step)
         timestamp = datetime.today().strftime('%Y-%m-%d')
-        output_file = f"{output_path}/02_df_cleaned_ready_for_engineering{timestamp}.csv"
-        df.to_csv(output_file, index=False)
-        print("🎉 Dataframe processed and ready for engineering! File saved as CSV.")
+        output_file = f"{output_path}/02_df_cleaned_ready_for_engineering{timestamp}.parquet"
+        df.to_parquet(output_file, index=False)
+        print("🎉 Dataframe processed and ready for engineering! File saved as Parquet.")
         
         # Return the processed dataframe
         return df, output_file
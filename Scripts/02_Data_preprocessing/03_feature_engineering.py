@@ -1,6 +1,12 @@
 import pandas as pd
 from datetime import datetime
 import numpy as np
+import sys
+from pathlib import Path
+
+# Shared column schema (Scripts/common/schema.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "common"))
+from schema import ENGINEERED_COLUMNS, PER_GAME, PER_GAME_STATS
 
 def engineering(df_cleaned, output_path):
 
@@ -14,20 +20,27 @@ def engineering(df_cleaned, output_path):
     - Computing per-game statistics to reduce season length bias (e.g. due to lockdowns).
     - Organizing features into logical groups for readability and consistency.
     - Dropping highly correlated or redundant features based on corr-SHAP analysis.
-    - Saving the final processed DataFrame to a timestamped CSV file.
+    - Saving the final processed DataFrame to a timestamped Parquet file.
 
     Args:
-        df_cleaned (str): Path to the cleaned CSV file.
-        output_path (str): Directory where the final CSV file will be saved.
+        df_cleaned (str): Path to the cleaned Parquet file.
+        output_path (str): Directory where the final Parquet file will be saved.
 
     Returns:
         pd.DataFrame: The engineered DataFrame ready for model training.
-        str: The path to the saved CSV file.
+        str: The path to the saved Parquet file.
     """
 
     try:
         # Load cleaned DataFrame
-        df_final = pd.read_csv(df_cleaned)
+        df_final = pd.read_parquet(df_cleaned)
+
+        # Narrow group keys (seasons fit in int16, conferences are 0/1) for the groupby below and downstream filters
+        # (conf must only hold 0/1, a float left by an imputation would be truncated silently by the cast)
+        if not df_final["conf"].isin([0, 1]).all():
+            raise ValueError("conf column must only contain 0 (E) or 1 (W)")
+        df_final["season_year"] = df_final["season_year"].astype("int16")
+        df_final["conf"] = df_final["conf"].astype("int8")
 
         # Feature engineering : ranking teams by conference and seasons
         df_final["team_standing"] = (df_final.groupby(["season_year", "conf"])["win_pct"]
@@ -35,54 +48,27 @@ def engineering(df_cleaned, output_path):
                                      .astype(int))
         
         # Averaging stats per game to reduce season lockdowns bias 
-        stats_to_avg = ['field_goal_made', 'field_goal_attempts', 'three_points_made', 'three_points_attempts', 
-                        'two_points_made', 'two_points_attempts', 'free_throws_made', 'free_throws_attempts',
-                        'offensive_rebonds', 'defensive_rebonds', 'total_rebonds', 'assists', 'steals', 'blocks', 
-                        'turnovers', 'personal_fouls', 'total_points']
+        # All per game stats are divided in one NumPy 2D operation and added with a single concat,
+        # players without any game played keep 0 (as well as missing stats)
+        totals = df_final[list(PER_GAME_STATS)].to_numpy(dtype=np.float64)
+        games = df_final['game_played'].to_numpy(dtype=np.float64)[:, None]
+        per_game = np.divide(totals, games, out=np.zeros_like(totals), where=games != 0)
+        np.nan_to_num(per_game, copy=False, nan=0.0)
+        df_final = pd.concat([df_final, pd.DataFrame(per_game, columns=list(PER_GAME), index=df_final.index)], axis=1)
 
-        for stat in stats_to_avg:
-            df_final[f'{stat}_per_game'] = (df_final[stat] / df_final['game_played'].replace(0, np.nan)).fillna(0)
-
-        # Reorganizing columns 
-        names_cols = ['player_name']
-        player_info = [
-            'position_C', 'position_PF', 'position_PG', 'position_SF', 'position_SG', 'age', 
-            'conf', 'win_pct', 'team_standing', 'game_played', 'game_starter', 'minutes_played'
-            ]
-        shooting_stats = [
-            'field_goal_made', 'field_goal_attempts', 'field_goal_percentage', 'three_points_made', 
-            'three_points_attempts', 'three_points_percentage', 'two_points_made', 'two_points_attempts', 
-            'two_points_percentage', 'effective_fg_percentage', 'free_throws_made','free_throws_attempts', 
-            'free_throws_percentage'
-            ] 
-        performance_stats = [
-            'offensive_rebonds', 'defensive_rebonds', 'total_rebonds', 'assists', 'steals', 'blocks', 
-            'turnovers', 'personal_fouls', 'total_points', 'triple_double'
-            ] 
-        
-        per_game_stats = [f'{stat}_per_game' for stat in stats_to_avg]
-
-        advanced_stats = [
-            "efficiency_rating", "true_shooting_%", "3pt_attempt_rate", "FT_attempt_rate", "off_reb_%", 
-            "def_reb_%", "total_reb_%", "assist_%", "steal_%", "blk_%", "turnover_%", "usage_%", 
-            "off_win_shares", "def_win_shares", "total_win_shares", "ws_per_48", "off_box_+/-", "def_box_+/-",
-            "box_+/-", "value_over_replacement"
-            ]
-        meta_cols = ['season_year', 'is_MVP']
-
-        df_final = df_final[names_cols + player_info + shooting_stats + performance_stats + per_game_stats + advanced_stats+ meta_cols]     
-        
-        # Dimensionality reduction : Drop highly correlated features based on corr-SHAP analysis
-        df_final = df_final.drop(columns=["field_goal_made", "three_points_made", "two_points_made", "free_throws_made",
-                                            "offensive_rebonds", "defensive_rebonds", "win_pct", "minutes_played", 
-                                            "personal_fouls", "game_starter", "off_box_+/-", "off_win_shares", "def_win_shares",
-                                            "two_points_attempts", "effective_fg_percentage", "efficiency_rating"])           
+        # Reorganizing columns and dimensionality reduction : drop highly correlated features based on corr-SHAP analysis
+        # (both in a single selection, see ENGINEERED_COLUMNS in the shared schema)
+        df_final = df_final[list(ENGINEERED_COLUMNS)]
 
         # Saving new dataframe
         timestamp = datetime.today().strftime('%Y-%m-%d')
-        output_file = f"{output_path}/03_df_advances_ready_for_training{timestamp}.csv"
-        df_final.to_csv(output_file, index=False)
-        print("🎉 Dataframe processed and ready for training! File saved as CSV.")   
+        output_file = f"{output_path}/03_df_advances_ready_for_training{timestamp}.parquet"
+        # Stats stored as float32 (the precision the model works with) and zstd-compressed,
+        # so the training and prediction steps read half the bytes
+        float_cols = df_final.select_dtypes("float64").columns
+        df_final = df_final.astype(dict.fromkeys(float_cols, np.float32))
+        df_final.to_parquet(output_file, index=False, compression="zstd")
+        print("🎉 Dataframe processed and ready for training! File saved as Parquet.")   
 
         return df_final, output_file
 
@@ -1,24 +1,31 @@
 import pandas as pd
-import pickle
-from xgboost import XGBRegressor
+import numpy as np
+import xgboost as xgb
 from NBA_modules import split_train_val_seasons
 from datetime import datetime
+import sys
+from pathlib import Path
 
-def train_mvp_model(input_path, output_path):
+# Shared column schema (Scripts/common/schema.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "common"))
+from schema import FEATURES
+
+def train_mvp_model(input_path, output_path, device="cpu"):
 
     """
     Train an XGBoost regression model to predict NBA MVP scores based on player statistics.
 
-    This function reads a preprocessed dataset from a CSV file, selects relevant features,
+    This function reads a preprocessed dataset from a Parquet file, selects relevant features,
     splits the data into training and validation sets based on season years, trains an 
-    XGBoost Regressor with early stopping, and saves the trained model as a pickle file.
+    XGBoost regression booster with early stopping, and saves the trained model in XGBoost's binary format.
 
     Args:
-        input_path (str): Path to the CSV file containing the processed dataset.
+        input_path (str): Path to the Parquet file containing the processed dataset.
         output_path (str): Directory path where the trained model will be saved.
+        device (str): Device used by XGBoost to build the trees, "cpu" (default) or "cuda".
 
     Returns:
-        None. The trained model is saved to disk as a pickle (.pkl) file.
+        None. The trained model is saved to disk as a UBJSON (.ubj) file.
 
     Notes:
         - The train/validation split is based on custom logic implemented in the
@@ -26,28 +33,16 @@ def train_mvp_model(input_path, output_path):
           training and validation.
         - The trained model is saved with a timestamp in its filename to avoid overwriting.
         - The model uses early stopping based on validation set performance to prevent overfitting.
+        - Training uses XGBoost's native API with the 'hist' tree method: the data is binned once into
+          QuantileDMatrix objects instead of being converted again by the sklearn wrapper.
+        - The saved model is an `xgb.Booster` truncated to the best iteration, predict with `inplace_predict`.
     """
     
     # Load preprocessed dataset
-    data = pd.read_csv(input_path)
+    data = pd.read_parquet(input_path)
     
     # Define the list of features to be used for training
-    features = [
-        'position_C', 'position_PF', 'position_PG', 'position_SF', 'position_SG', 'age', 'conf', 'team_standing',
-        'game_played', 'field_goal_attempts', 'field_goal_percentage', 'three_points_attempts',
-        'three_points_percentage', 'two_points_percentage',
-        'free_throws_attempts', 'free_throws_percentage', 'total_rebonds', 'assists', 'steals', 'blocks', 'turnovers',
-        'total_points', 'triple_double', 'true_shooting_%', '3pt_attempt_rate', 'FT_attempt_rate', 'off_reb_%',
-        'def_reb_%', 'total_reb_%', 'assist_%', 'steal_%', 'blk_%', 'turnover_%', 'usage_%',
-        'total_win_shares', 'ws_per_48', 'def_box_+/-', 'box_+/-', 'value_over_replacement',
-
-        # Per game stats
-        'field_goal_made_per_game', 'field_goal_attempts_per_game', 'three_points_made_per_game',
-        'three_points_attempts_per_game', 'two_points_made_per_game', 'two_points_attempts_per_game',
-        'free_throws_made_per_game', 'free_throws_attempts_per_game', 'offensive_rebonds_per_game',
-        'defensive_rebonds_per_game', 'total_rebonds_per_game', 'assists_per_game', 'steals_per_game',
-        'blocks_per_game', 'turnovers_per_game', 'personal_fouls_per_game', 'total_points_per_game'
-    ]
+    features = list(FEATURES)
 
     # Split the dataset into training and validation seasons using a custom function
     val_seasons, train_seasons = split_train_val_seasons(input_path)
@@ -57,20 +52,29 @@ def train_mvp_model(input_path, output_path):
     val_mask = data['season_year'].isin(val_seasons)
 
     # Split the data into features (X) and target (y) for training and validation sets
-    train_X = data.loc[train_mask, features]
-    train_y = data.loc[train_mask, 'is_MVP']
-    val_X = data.loc[val_mask, features]
-    val_y = data.loc[val_mask, 'is_MVP']
+    train_X = data.loc[train_mask, features].astype(np.float32)
+    train_y = data.loc[train_mask, 'is_MVP'].to_numpy(np.float32)
+    val_X = data.loc[val_mask, features].astype(np.float32)
+    val_y = data.loc[val_mask, 'is_MVP'].to_numpy(np.float32)
+
+    # Bin the features once, the validation set reuses the training quantiles
+    dtrain = xgb.QuantileDMatrix(train_X, label=train_y)
+    dval = xgb.QuantileDMatrix(val_X, label=val_y, ref=dtrain)
+
+    # Train the XGBoost regressor with early stopping on validation RMSE
+    params = {"objective": "reg:squarederror", "tree_method": "hist", "device": device,
+              "learning_rate": 0.01, "eval_metric": "rmse"}
+    booster = xgb.train(params, dtrain, num_boost_round=3000, evals=[(dval, "val")],
+                        early_stopping_rounds=50, verbose_eval=False)
 
-    # Initialize and train the XGBoost Regressor with early stopping on validation RMSE
-    model = XGBRegressor(n_estimators=3000, learning_rate=0.01, eval_metric="rmse", early_stopping_rounds=50)
-    model.fit(train_X, train_y, eval_set=[(val_X, val_y)], verbose=False)
+    # Keep only the trees up to the best iteration, as the sklearn wrapper did when predicting
+    model = booster[: booster.best_iteration + 1]
 
     # Generate a timestamp to uniquely identify model file and save it
     timestamp = datetime.today().strftime('%Y-%m-%d')
-    model_filename = f"{output_path}/mvp_xgb_advancedfeatures_model{timestamp}.pkl"
-    with open(model_filename, 'wb') as file:
-        pickle.dump(model, file)
+    # XGBoost's own binary format loads much faster than a pickle and doesn't depend on the Python version
+    model_filename = f"{output_path}/mvp_xgb_advancedfeatures_model{timestamp}.ubj"
+    model.save_model(model_filename)
 
     # Confirmation message
     print(f"Modèle entraîné et sauvegardé dans {model_filename}") 
@@ -1,12 +1,12 @@
+import os
 import pandas as pd
-
-file_path = "/path/to/intput/engineered_dataframe"
+from functools import lru_cache
 
 def split_train_val_seasons(file_path):
     """
     Split NBA seasons into training and validation sets for MVP prediction modeling.
     
-    This function loads NBA data from a CSV file and divides the seasons into separate
+    This function loads NBA data from a Parquet file and divides the seasons into separate
     training and validation sets. Instead of using random splitting from sklearn, 
     this approach gives precise control over which seasons are used for training
     and which for validation, ensuring temporal consistency in the evaluation.
@@ -14,7 +14,7 @@ def split_train_val_seasons(file_path):
     Parameters:
     -----------
     file_path : str
-        Path to the CSV file containing NBA data with a 'season_year' column
+        Path to the Parquet file containing NBA data with a 'season_year' column
         
     Returns:
     --------
@@ -33,24 +33,31 @@ def split_train_val_seasons(file_path):
     - Validation set includes every other year starting from 2005 up to 2023
     - 2024 season is explicitly excluded from both training and validation sets
     - This approach ensures chronological separation between training and validation
+    - Only the 'season_year' column is read, and the split is cached for as long as the file is unchanged
     """
 
     try:
-        data = pd.read_csv(file_path)
-        seasons = set(map(int, data["season_year"].unique()))  # Convert all to int immediately
-
-        val_set = {2023, 2021, 2019, 2017, 2015, 2013, 2011, 2009, 2007, 2005}  # Set for easy subtraction
-        train_set = seasons - val_set - {2024}  # Exclude validation seasons and 2024
-
-        return sorted(list(val_set)), sorted(list(train_set))  # Return sorted lists for clarity
+        val_set, train_set = _split_seasons(file_path, os.path.getmtime(file_path))
+        return list(val_set), list(train_set)  # Copies, the cached tuples are shared between calls
 
     except Exception as e:
         print(f"An error occurred during validation or training season splits: {e}")
         raise
 
-val_set, train_set = split_train_val_seasons(file_path)
-print("Validation Seasons:", val_set)
-print("Training Seasons:", train_set)
+@lru_cache(maxsize=8)
+def _split_seasons(file_path, mtime):
+    """Cached split of `split_train_val_seasons`, keyed on the file path and its modification time."""
+
+    data = pd.read_parquet(file_path, columns=["season_year"])
+    seasons = set(map(int, data["season_year"].unique()))  # Convert all to int immediately
+
+    val_set = {2023, 2021, 2019, 2017, 2015, 2013, 2011, 2009, 2007, 2005}  # Set for easy subtraction
+    train_set = seasons - val_set - {2024}  # Exclude validation seasons and 2024
+
+    return tuple(sorted(val_set)), tuple(sorted(train_set))  # Sorted for clarity
 
 if __name__ == "__main__": 
-    split_train_val_seasons(file_path)
\ No newline at end of file
+    file_path = "/path/to/intput/engineered_dataframe"
+    val_set, train_set = split_train_val_seasons(file_path)
+    print("Validation Seasons:", val_set)
+    print("Training Seasons:", train_set)
\ No newline at end of file
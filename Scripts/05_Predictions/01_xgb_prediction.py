@@ -1,81 +1,171 @@
 import pandas as pd
-import pickle
 import numpy as np
+import sys
+from pathlib import Path
 
+# Shared column schema (Scripts/common/schema.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "common"))
+from schema import FEATURES
+from models import load_model
 
-import pandas as pd
-import pickle
-import numpy as np
+# Load the trained model (see Scripts/common/models.py).
+# Predictions score one season (a few hundred rows) at a time, a single thread avoids the cost
+# of starting a thread pool for each call which would outweigh the prediction itself
+def load_prediction_model(model_path):
+    model = load_model(model_path)
+    model.set_param({"nthread": 1})
+    return model
 
-# Load the trained model from a pickle file
-def load_model(model_path):
-    with open(model_path, 'rb') as file:
-        return pickle.load(file)
+# Predictions are made on NumPy arrays, which XGBoost doesn't check against the feature names:
+# check once, after loading, that the model expects the features in the same order
+def check_feature_order(model, features):
+    if model.feature_names is not None and list(model.feature_names) != list(features):
+        raise ValueError("Le modèle a été entraîné avec des features différentes (ou dans un autre ordre).")
 
-def predict_the_mvp(dataframe, season, features, top_n=3, display=True):
+def prepare_features(dataframe, features):
+    """
+    Extract the features of the whole `dataframe` as a contiguous float32 matrix, along with
+    the positions of the rows of each season, so predictions only index into a ready matrix.
+    The caller keeps the result and passes it as `prepared` to the prediction functions to reuse it
+    between calls (to be prepared again if the dataframe is modified).
+
+    Returns:
+    - feature_matrix: float32 array of shape (rows, features)
+    - season_rows: dict season_year -> positions of the season's rows
+    """
+    # Integer positions of the features, looked up and checked once
+    positions = dataframe.columns.get_indexer(features)
+    if (positions < 0).any():
+        missing = [feature for feature, position in zip(features, positions) if position < 0]
+        raise ValueError(f"Features absentes du dataframe : {missing}")
+    feature_matrix = np.ascontiguousarray(dataframe.iloc[:, positions].to_numpy(np.float32))
+    season_rows = dataframe.groupby('season_year').indices
+    return feature_matrix, season_rows
+
+def predict_the_mvp(model, dataframe, season, features, top_n=3, display=True, full_sort=False, candidates=None,
+                    prepared=None):
     """
     Predict MVP candidates for a given season and display the top N predictions.
     
     Parameters:
+    - model: trained xgb.Booster, as returned by `load_prediction_model` (loaded once and reused between calls)
     - dataframe: full dataset containing all seasons
     - season: season year to predict (e.g. 2025)
     - features: list of features used by the model
     - top_n: number of top candidates to display
     - display: whether to print the results
+    - full_sort: return the whole season ranked instead of only the top N candidates
+    - candidates: if set, only the `candidates` players with the highest value over replacement
+      are scored by the model (e.g. 20), the others can't be ranked (None scores everyone)
+    - prepared: result of `prepare_features(dataframe, features)`, prepared for this call if None
     
     Returns:
-    - A DataFrame sorted by predicted MVP score for the season
+    - A DataFrame of the top N candidates of the season (every player scored if `full_sort`),
+      sorted by predicted MVP score, with their predicted probability (only set for the top N)
     """
-    season_data = dataframe[dataframe['season_year'] == season].copy()
+    feature_matrix, season_rows = prepared if prepared is not None else prepare_features(dataframe, features)
+    rows = season_rows.get(season)
 
-    if season_data.empty:
+    if rows is None:
         raise ValueError(f"Aucune donnée trouvée pour la saison {season}.")
+    rows = _candidate_rows(feature_matrix, rows, features, candidates)
+
+    # Results prediction on a contiguous float32 matrix (the precision XGBoost works with),
+    # passed straight to the booster without any conversion on its side
+    scores = model.inplace_predict(feature_matrix[rows])
+
+    return _rank_season(dataframe, season, rows, scores, top_n, display, full_sort)
 
-    # Results prediction
-    season_data['predicted_score'] = model.predict(season_data[features])
+def predict_the_mvp_batch(model, dataframe, seasons, features, top_n=3, display=True, full_sort=False, candidates=None,
+                          prepared=None):
+    """
+    Predict MVP candidates for several seasons with a single prediction call, then rank each season
+    exactly like `predict_the_mvp` (same parameters, `seasons` being a list of season years).
     
-    # Players ranking
-    season_data = season_data.sort_values(by='predicted_score', ascending=False)
+    Returns:
+    - A dict season_year -> DataFrame of the season's top N candidates (see `predict_the_mvp`)
+    """
+    if not seasons:
+        return {}
 
-    # Focus on top N
-    top_players = season_data.head(top_n).copy()
+    feature_matrix, season_rows = prepared if prepared is not None else prepare_features(dataframe, features)
+    missing = [season for season in seasons if season not in season_rows]
+    if missing:
+        raise ValueError(f"Aucune donnée trouvée pour les saisons {missing}.")
 
-    # Normalize over top N
-    top_scores = top_players['predicted_score'].values
-    total_top_scores = np.sum(top_scores)
-    top_players['predicted_probability'] = (top_scores / total_top_scores * 100).round(2)
+    # Stack the rows of every season, predict once, then split the scores back per season
+    all_rows = [_candidate_rows(feature_matrix, season_rows[season], features, candidates) for season in seasons]
+    all_scores = model.inplace_predict(feature_matrix[np.concatenate(all_rows)])
+    offsets = np.cumsum([rows.size for rows in all_rows])[:-1]
+
+    return {
+        season: _rank_season(dataframe, season, rows, scores, top_n, display, full_sort)
+        for season, rows, scores in zip(seasons, all_rows, np.split(all_scores, offsets))
+    }
+
+def _candidate_rows(feature_matrix, rows, features, candidates):
+    """
+    Keep only the `candidates` rows with the highest value over replacement (cheap pre-selection,
+    MVPs are always among the season's best VORP), or all `rows` if `candidates` is None.
+    """
+    if candidates is None:
+        return rows
+    if candidates < 1:
+        raise ValueError(f"Le nombre de candidats doit être au moins 1 (reçu {candidates}).")
+    if rows.size <= candidates:
+        return rows
+    vorp = feature_matrix[rows, list(features).index('value_over_replacement')]
+    # Back in dataframe order, so tied players are ranked like without the pre-selection
+    return rows[np.sort(np.argpartition(-vorp, candidates - 1)[:candidates])]
+
+def _rank_season(dataframe, season, rows, scores, top_n, display, full_sort):
+    """Rank the players of one season (`rows` positions in `dataframe`) from their predicted `scores`."""
+
+    # Focus on top N: partial selection with argpartition, then only these N scores are sorted
+    # (the whole season is sorted only if the caller asks for the full ranking).
+    # Stable sorts keep tied players in dataframe order, whatever the path
+    if full_sort:
+        ranked = np.argsort(-scores, kind="stable")
+    else:
+        k = min(top_n, scores.size)
+        ranked = np.sort(np.argpartition(-scores, k - 1)[:k])
+        ranked = ranked[np.argsort(-scores[ranked], kind="stable")]
+
+    # Normalize over top N (plain arrays, the output DataFrame is only assembled once at the end)
+    ranked_scores = scores[ranked]
+    top_scores = ranked_scores[:top_n]
+    # (computed and rounded in place, straight into the top N slots of the probability column)
+    probabilities = np.full(ranked.size, np.nan)
+    top_probabilities = probabilities[:top_scores.size]
+    np.multiply(top_scores, 100.0 / top_scores.sum(), out=top_probabilities)
+    np.round(top_probabilities, 2, out=top_probabilities)
 
     if display:
+        names = dataframe['player_name'].to_numpy()[rows[ranked[:top_n]]]
         print(f"\nTop {top_n} MVP predictions for the {season} - {season + 1} season:\n")
-        for i, (_, row) in enumerate(top_players.iterrows(), 1):
-            print(f"{i}. {row['player_name']}: {row['predicted_probability']:.2f}%")
+        for i, (name, probability) in enumerate(zip(names, probabilities[:top_n]), 1):
+            print(f"{i}. {name}: {probability:.2f}%")
+
+    # Only the ranked rows are taken out of the dataframe
+    top_players = dataframe.iloc[rows[ranked]].assign(predicted_score=ranked_scores,
+                                                      predicted_probability=probabilities)
     
-    return season_data
+    return top_players
 
 
 if __name__ == "__main__":
     model_path = "/Users/sebastianestephe/Desktop/Python_-_Projet_Perso/03-ML_NBA_MVP/Models/mvp_xgb_advancedfeatures_model2025-04-22.pkl"
-    data_path = "/Users/sebastianestephe/Desktop/Python_-_Projet_Perso/03-ML_NBA_MVP/Data/03_df_2024_ready_for_prediction2025-04-22.csv"
-
-    # Load model and dataframe
-    model = load_model(model_path)
-    dataframe = pd.read_csv(data_path)
+    data_path = "/Users/sebastianestephe/Desktop/Python_-_Projet_Perso/03-ML_NBA_MVP/Data/03_df_2024_ready_for_prediction2025-04-22.parquet"
 
     season = 2024
+    features = list(FEATURES)
+
+    # Load model and dataframe (only the columns used, features as float32)
+    model = load_prediction_model(model_path)
+    dataframe = pd.read_parquet(data_path, columns=['player_name', 'season_year'] + features)
+    dataframe = dataframe.astype({**dict.fromkeys(features, np.float32), 'season_year': np.int16})
+
+    check_feature_order(model, features)
+    prepared = prepare_features(dataframe, features)
 
-    features = [
-        'position_C', 'position_PF', 'position_PG', 'position_SF', 'position_SG', 'age', 'conf', 'team_standing',
-        'game_played', 'field_goal_attempts', 'field_goal_percentage', 'three_points_attempts',
-        'three_points_percentage', 'two_points_percentage',
-        'free_throws_attempts', 'free_throws_percentage', 'total_rebonds', 'assists', 'steals', 'blocks', 'turnovers',
-        'total_points', 'triple_double', 'true_shooting_%', '3pt_attempt_rate', 'FT_attempt_rate', 'off_reb_%',
-        'def_reb_%', 'total_reb_%', 'assist_%', 'steal_%', 'blk_%', 'turnover_%', 'usage_%',
-        'total_win_shares', 'ws_per_48', 'def_box_+/-', 'box_+/-', 'value_over_replacement',
-        'field_goal_made_per_game', 'field_goal_attempts_per_game', 'three_points_made_per_game',
-        'three_points_attempts_per_game', 'two_points_made_per_game', 'two_points_attempts_per_game',
-        'free_throws_made_per_game', 'free_throws_attempts_per_game', 'offensive_rebonds_per_game',
-        'defensive_rebonds_per_game', 'total_rebonds_per_game', 'assists_per_game', 'steals_per_game',
-        'blocks_per_game', 'turnovers_per_game', 'personal_fouls_per_game', 'total_points_per_game'
-    ]
-
-    predict_the_mvp(dataframe, season, features, top_n=3, display=True)
\ No newline at end of file
+    predict_the_mvp(model, dataframe, season, features, top_n=3, display=True, prepared=prepared)
@@ -0,0 +1,29 @@
+"""
+Model loading shared by the evaluation and prediction scripts.
+
+Import it after adding this folder to `sys.path`, like `schema.py`:
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "common"))
+    from models import load_model
+"""
+
+import pickle
+import xgboost as xgb
+
+def load_model(model_path):
+    """
+    Load the trained model as an `xgb.Booster`, from XGBoost's binary (.ubj) or JSON format.
+
+    Models saved by older versions of the training script are pickled `XGBRegressor` objects,
+    their booster is extracted and truncated to the best iteration like the wrapper's predictions.
+    Thread settings are left to the caller (`booster.set_param({"nthread": ...})`).
+    """
+    if model_path.endswith((".ubj", ".json")):
+        return xgb.Booster(model_file=model_path)
+    with open(model_path, 'rb') as file:
+        model = pickle.load(file)
+    if isinstance(model, xgb.XGBRegressor):
+        booster = model.get_booster()
+        best_iteration = getattr(model, "best_iteration", None)
+        model = booster[: best_iteration + 1] if best_iteration is not None else booster
+    return model
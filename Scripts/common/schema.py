@@ -0,0 +1,83 @@
+"""
+Column schema shared by the preprocessing, training, evaluation and prediction scripts.
+
+Every group of columns is defined once here, as tuples, so the scripts can't drift apart
+(a feature renamed or dropped in one step but not in the others).
+Import it after adding this folder to `sys.path`, e.g. from a script of `Scripts/02_Data_preprocessing`:
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "common"))
+    from schema import FEATURES
+"""
+
+NAMES = ("player_name",)
+
+POSITIONS = ("position_C", "position_PF", "position_PG", "position_SF", "position_SG")
+
+# Player and team info, after cleaning (02) and after feature engineering (03, adds the team standing)
+PLAYER_INFO = POSITIONS + ("age", "conf", "win_pct", "game_played", "game_starter", "minutes_played")
+ENGINEERED_PLAYER_INFO = POSITIONS + (
+    "age", "conf", "win_pct", "team_standing", "game_played", "game_starter", "minutes_played"
+)
+
+SHOOTING = (
+    "field_goal_made", "field_goal_attempts", "field_goal_percentage", "three_points_made",
+    "three_points_attempts", "three_points_percentage", "two_points_made", "two_points_attempts",
+    "two_points_percentage", "effective_fg_percentage", "free_throws_made", "free_throws_attempts",
+    "free_throws_percentage"
+)
+
+PERF = (
+    "offensive_rebonds", "defensive_rebonds", "total_rebonds", "assists", "steals", "blocks",
+    "turnovers", "personal_fouls", "total_points", "triple_double"
+)
+
+# Season totals averaged per game played, and the names of the resulting columns
+PER_GAME_STATS = (
+    "field_goal_made", "field_goal_attempts", "three_points_made", "three_points_attempts",
+    "two_points_made", "two_points_attempts", "free_throws_made", "free_throws_attempts",
+    "offensive_rebonds", "defensive_rebonds", "total_rebonds", "assists", "steals", "blocks",
+    "turnovers", "personal_fouls", "total_points"
+)
+PER_GAME = tuple(f"{stat}_per_game" for stat in PER_GAME_STATS)
+
+ADVANCED = (
+    "efficiency_rating", "true_shooting_%", "3pt_attempt_rate", "FT_attempt_rate", "off_reb_%",
+    "def_reb_%", "total_reb_%", "assist_%", "steal_%", "blk_%", "turnover_%", "usage_%",
+    "off_win_shares", "def_win_shares", "total_win_shares", "ws_per_48", "off_box_+/-", "def_box_+/-",
+    "box_+/-", "value_over_replacement"
+)
+
+META = ("season_year", "is_MVP")
+
+# Highly correlated features dropped during feature engineering, based on corr-SHAP analysis
+DROPPED_FEATURES = (
+    "field_goal_made", "three_points_made", "two_points_made", "free_throws_made",
+    "offensive_rebonds", "defensive_rebonds", "win_pct", "minutes_played",
+    "personal_fouls", "game_starter", "off_box_+/-", "off_win_shares", "def_win_shares",
+    "two_points_attempts", "effective_fg_percentage", "efficiency_rating"
+)
+
+# Columns (in order) of the cleaned dataframe (02) and of the engineered dataframe (03)
+CLEANED_COLUMNS = NAMES + PLAYER_INFO + SHOOTING + PERF + ADVANCED + META
+ENGINEERED_COLUMNS = tuple(
+    col for col in NAMES + ENGINEERED_PLAYER_INFO + SHOOTING + PERF + PER_GAME + ADVANCED + META
+    if col not in DROPPED_FEATURES
+)
+
+# Features of the model, in the order the model was trained with (don't reorder, saved models depend on it)
+FEATURES = (
+    "position_C", "position_PF", "position_PG", "position_SF", "position_SG", "age", "conf", "team_standing",
+    "game_played", "field_goal_attempts", "field_goal_percentage", "three_points_attempts",
+    "three_points_percentage", "two_points_percentage",
+    "free_throws_attempts", "free_throws_percentage", "total_rebonds", "assists", "steals", "blocks", "turnovers",
+    "total_points", "triple_double", "true_shooting_%", "3pt_attempt_rate", "FT_attempt_rate", "off_reb_%",
+    "def_reb_%", "total_reb_%", "assist_%", "steal_%", "blk_%", "turnover_%", "usage_%",
+    "total_win_shares", "ws_per_48", "def_box_+/-", "box_+/-", "value_over_replacement",
+
+    # Per game stats
+    "field_goal_made_per_game", "field_goal_attempts_per_game", "three_points_made_per_game",
+    "three_points_attempts_per_game", "two_points_made_per_game", "two_points_attempts_per_game",
+    "free_throws_made_per_game", "free_throws_attempts_per_game", "offensive_rebonds_per_game",
+    "defensive_rebonds_per_game", "total_rebonds_per_game", "assists_per_game", "steals_per_game",
+    "blocks_per_game", "turnovers_per_game", "personal_fouls_per_game", "total_points_per_game"
+)